@@ -21,7 +21,7 @@ indexing).
 import math
 import copy
 import numpy as np
-from taxcalc.decorators import iterate_jit, JIT
+from taxcalc.decorators import iterate_jit, cache_safe_jit
 
 
 def BenefitPrograms(calc):
@@ -98,7 +98,7 @@ def BenefitPrograms(calc):
     calc.array('benefit_value_total', value)
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def EI_PayrollTax(SS_Earnings_c, e00200p, e00200s, pencon_p, pencon_s,
                   FICA_ss_trt, FICA_mc_trt, ALD_SelfEmploymentTax_hc,
                   SS_Earnings_thd, e00900p, e00900s, e02100p, e02100s, k1bx14p,
@@ -268,7 +268,7 @@ def EI_PayrollTax(SS_Earnings_c, e00200p, e00200s, pencon_p, pencon_s,
             earned, earned_p, earned_s, was_plus_sey_p, was_plus_sey_s)
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def DependentCare(nu13, elderly_dependents, earned,
                   MARS, ALD_Dependents_thd, ALD_Dependents_hc,
                   ALD_Dependents_Child_c, ALD_Dependents_Elder_c,
@@ -311,7 +311,7 @@ def DependentCare(nu13, elderly_dependents, earned,
     return care_deduction
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def Adj(e03150, e03210, c03260,
         e03270, e03300, e03400, e03500, e00800,
         e03220, e03230, e03240, e03290, care_deduction,
@@ -397,7 +397,7 @@ def Adj(e03150, e03210, c03260,
     return c02900
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def ALD_InvInc_ec_base(p22250, p23250, sep,
                        e00300, e00600, e01100, e01200,
                        invinc_ec_base):
@@ -435,7 +435,7 @@ def ALD_InvInc_ec_base(p22250, p23250, sep,
     return invinc_ec_base
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def CapGains(p23250, p22250, sep, ALD_StudentLoan_hc,
              ALD_InvInc_ec_rt, invinc_ec_base,
              e00200, e00300, e00600, e00650, e00700, e00800,
@@ -561,7 +561,7 @@ def CapGains(p23250, p22250, sep, ALD_StudentLoan_hc,
     return (c01000, c23650, ymod, ymod1, invinc_agi_ec)
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def SSBenefits(MARS, ymod, e02400, SS_thd50, SS_thd85,
                SS_percentage1, SS_percentage2, c02500):
     """
@@ -603,7 +603,7 @@ def SSBenefits(MARS, ymod, e02400, SS_thd50, SS_thd85,
     return c02500
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def UBI(nu18, n1820, n21, UBI_u18, UBI_1820, UBI_21, UBI_ecrt,
         ubi, taxable_ubi, nontaxable_ubi):
     """
@@ -647,7 +647,7 @@ def UBI(nu18, n1820, n21, UBI_u18, UBI_1820, UBI_21, UBI_ecrt,
     return ubi, taxable_ubi, nontaxable_ubi
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def AGI(ymod1, c02500, c02900, XTOT, MARS, sep, DSI, exact, nu18, taxable_ubi,
         II_em, II_em_ps, II_prt, II_no_em_nu18,
         c00100, pre_c04600, c04600):
@@ -723,7 +723,7 @@ def AGI(ymod1, c02500, c02900, XTOT, MARS, sep, DSI, exact, nu18, taxable_ubi,
     return (c00100, pre_c04600, c04600)
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def ItemDedCap(e17500, e18400, e18500, e19200, e19800, e20100, e20400, g20500,
                c00100, ID_AmountCap_rt, ID_AmountCap_Switch, e17500_capped,
                e18400_capped, e18500_capped, e19200_capped, e19800_capped,
@@ -843,7 +843,7 @@ def ItemDedCap(e17500, e18400, e18500, e19200, e19800, e20100, e20400, g20500,
             e20400_capped, e19200_capped, e19800_capped, e20100_capped)
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def ItemDed(e17500_capped, e18400_capped, e18500_capped, e19200_capped,
             e19800_capped, e20100_capped, e20400_capped, g20500_capped,
             MARS, age_head, age_spouse, c00100, c04470, c21040, c21060,
@@ -1045,7 +1045,7 @@ def ItemDed(e17500_capped, e18400_capped, e18500_capped, e19200_capped,
             c21040, c21060, c04470)
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def AdditionalMedicareTax(e00200, MARS,
                           AMEDT_ec, sey, AMEDT_rt,
                           FICA_mc_trt, FICA_ss_trt,
@@ -1089,7 +1089,7 @@ def AdditionalMedicareTax(e00200, MARS,
     return (ptax_amc, payrolltax)
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def StdDed(DSI, earned, STD, age_head, age_spouse, STD_Aged, STD_Dep,
            MARS, MIDR, blind_head, blind_spouse, standard, c19700,
            STD_allow_charity_ded_nonitemizers,
@@ -1147,11 +1147,9 @@ def StdDed(DSI, earned, STD, age_head, age_spouse, STD_Aged, STD_Dep,
         else:
             basic_stded = STD[MARS - 1]
     # calculate extra standard deduction for aged and blind
-    num_extra_stded = blind_head + blind_spouse
-    if age_head >= 65:
-        num_extra_stded += 1
-    if MARS == 2 and age_spouse >= 65:
-        num_extra_stded += 1
+    # (counting aged head and spouse arithmetically rather than by branching)
+    num_extra_stded = (blind_head + blind_spouse + (age_head >= 65) +
+                       (MARS == 2) * (age_spouse >= 65))
     extra_stded = num_extra_stded * STD_Aged[MARS - 1]
     # calculate the total standard deduction
     standard = basic_stded + extra_stded
@@ -1162,7 +1160,7 @@ def StdDed(DSI, earned, STD, age_head, age_spouse, STD_Aged, STD_Dep,
     return standard
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def TaxInc(c00100, standard, c04470, c04600, MARS, e00900, e26270,
            e02100, e27200, e00650, c01000, e02300, PT_SSTB_income,
            PT_binc_w2_wages, PT_ubia_property, PT_qbid_rt,
@@ -1299,7 +1297,7 @@ def TaxInc(c00100, standard, c04470, c04600, MARS, e00900, e26270,
     return (c04800, qbided)
 
 
-@JIT(nopython=True)
+@cache_safe_jit(nopython=True, cache=True)
 def SchXYZ(taxable_income, MARS, e00900, e26270, e02000, e00200,
            PT_rt1, PT_rt2, PT_rt3, PT_rt4, PT_rt5,
            PT_rt6, PT_rt7, PT_rt8,
@@ -1445,7 +1443,7 @@ def SchXYZ(taxable_income, MARS, e00900, e26270, e02000, e00200,
     return reg_tax + pt_tax
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def SchXYZTax(c04800, MARS, e00900, e26270, e02000, e00200,
               PT_rt1, PT_rt2, PT_rt3, PT_rt4, PT_rt5,
               PT_rt6, PT_rt7, PT_rt8,
@@ -1564,7 +1562,7 @@ def SchXYZTax(c04800, MARS, e00900, e26270, e02000, e00200,
     return c05200
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def GainsTax(e00650, c01000, c23650, p23250, e01100, e58990, e00200,
              e24515, e24518, MARS, c04800, c05200, e00900, e26270, e02000,
              II_rt1, II_rt2, II_rt3, II_rt4, II_rt5, II_rt6, II_rt7, II_rt8,
@@ -1821,7 +1819,7 @@ def GainsTax(e00650, c01000, c23650, p23250, e01100, e58990, e00200,
     return (dwks10, dwks13, dwks14, dwks19, c05700, taxbc)
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def AGIsurtax(c00100, MARS, AGI_surtax_trt, AGI_surtax_thd, taxbc, surtax):
     """
     Computes surtax on AGI above some threshold.
@@ -1855,7 +1853,7 @@ def AGIsurtax(c00100, MARS, AGI_surtax_trt, AGI_surtax_thd, taxbc, surtax):
     return (taxbc, surtax)
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def AMT(e07300, dwks13, standard, f6251, c00100, c18300, taxbc,
         c04470, c17000, c20800, c21040, e24515, MARS, sep, dwks19,
         dwks14, c05700, e62900, e00700, dwks10, age_head, age_spouse,
@@ -2047,7 +2045,7 @@ def AMT(e07300, dwks13, standard, f6251, c00100, c18300, taxbc,
     return (c62100, c09600, c05800)
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def NetInvIncTax(e00300, e00600, e02000, e26270, c01000,
                  c00100, NIIT_thd, MARS, NIIT_PT_taxed, NIIT_rt, niit):
     """
@@ -2093,7 +2091,7 @@ def NetInvIncTax(e00300, e00600, e02000, e26270, c01000,
     return niit
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def F2441(MARS, earned_p, earned_s, f2441, CDCC_c, e32800,
           exact, c00100, CDCC_ps, CDCC_ps2, CDCC_crt, CDCC_frt,
           CDCC_prt, CDCC_refundable, c05800, e07300, c07180, CDCC_refund):
@@ -2170,7 +2168,7 @@ def F2441(MARS, earned_p, earned_s, f2441, CDCC_c, e32800,
     return (c07180, CDCC_refund)
 
 
-@JIT(nopython=True)
+@cache_safe_jit(nopython=True, cache=True)
 def EITCamount(basic_frac, phasein_rate, earnings, max_amount,
                phaseout_start, agi, phaseout_rate):
     """
@@ -2210,7 +2208,7 @@ def EITCamount(basic_frac, phasein_rate, earnings, max_amount,
     return eitc
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def EITC(MARS, DSI, EIC, c00100, e00300, e00400, e00600, c01000,
          e02000, e26270, age_head, age_spouse, earned, earned_p, earned_s,
          EITC_ps, EITC_MinEligAge, EITC_MaxEligAge, EITC_ps_MarriedJ,
@@ -2343,7 +2341,7 @@ def EITC(MARS, DSI, EIC, c00100, e00300, e00400, e00600, c01000,
     return c59660
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def RefundablePayrollTaxCredit(was_plus_sey_p, was_plus_sey_s,
                                RPTC_c, RPTC_rt,
                                rptc_p, rptc_s, rptc):
@@ -2382,7 +2380,7 @@ def RefundablePayrollTaxCredit(was_plus_sey_p, was_plus_sey_s,
     return (rptc_p, rptc_s, rptc)
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def ChildDepTaxCredit(n24, MARS, c00100, XTOT, num, c05800,
                       e07260, CR_ResidentialEnergy_hc,
                       e07300, CR_ForeignTax_hc,
@@ -2508,7 +2506,7 @@ def ChildDepTaxCredit(n24, MARS, c00100, XTOT, num, c05800,
     return (c07220, odc, codtc_limited)
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def PersonalTaxCredit(MARS, c00100, XTOT, nu18,
                       II_credit, II_credit_ps, II_credit_prt,
                       II_credit_nr, II_credit_nr_ps, II_credit_nr_prt,
@@ -2569,17 +2567,12 @@ def PersonalTaxCredit(MARS, c00100, XTOT, nu18,
         Personal rebate credit
     """
     # calculate personal refundable credit amount with phase-out
-    personal_refundable_credit = II_credit[MARS - 1]
-    if II_credit_prt > 0. and c00100 > II_credit_ps[MARS - 1]:
-        pout = II_credit_prt * (c00100 - II_credit_ps[MARS - 1])
-        fully_phasedout = personal_refundable_credit - pout
-        personal_refundable_credit = max(0., fully_phasedout)
+    # (phase-out amount is zero when AGI is at or below phase-out start)
+    pout = II_credit_prt * max(0., c00100 - II_credit_ps[MARS - 1])
+    personal_refundable_credit = max(0., II_credit[MARS - 1] - pout)
     # calculate personal nonrefundable credit amount with phase-out
-    personal_nonrefundable_credit = II_credit_nr[MARS - 1]
-    if II_credit_nr_prt > 0. and c00100 > II_credit_nr_ps[MARS - 1]:
-        pout = II_credit_nr_prt * (c00100 - II_credit_nr_ps[MARS - 1])
-        fully_phasedout = personal_nonrefundable_credit - pout
-        personal_nonrefundable_credit = max(0., fully_phasedout)
+    pout = II_credit_nr_prt * max(0., c00100 - II_credit_nr_ps[MARS - 1])
+    personal_nonrefundable_credit = max(0., II_credit_nr[MARS - 1] - pout)
     # calculate Recovery Rebate Credit from CARES Act 2020 and/or ARPA 2021
     if c00100 < RRC_ps[MARS - 1]:
         recovery_rebate_credit = RRC_c * XTOT
@@ -2595,7 +2588,7 @@ def PersonalTaxCredit(MARS, c00100, XTOT, nu18,
             recovery_rebate_credit)
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def AmOppCreditParts(exact, e87521, num, c00100, CR_AmOppRefundable_hc,
                      CR_AmOppNonRefundable_hc, c10960, c87668):
     """
@@ -2653,7 +2646,7 @@ def AmOppCreditParts(exact, e87521, num, c00100, CR_AmOppRefundable_hc,
     return (c10960, c87668)
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def SchR(age_head, age_spouse, MARS, c00100,
          c05800, e07300, c07180, e02400, c02500, e01500, e01700, CR_SchR_hc,
          c07200):
@@ -2742,7 +2735,7 @@ def SchR(age_head, age_spouse, MARS, c00100,
     return c07200
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def EducationTaxCredit(exact, e87530, MARS, c00100, num, c05800,
                        e07300, c07180, c07200, c87668,
                        LLC_Expense_c, ETC_pe_Single, ETC_pe_Married,
@@ -2816,7 +2809,7 @@ def EducationTaxCredit(exact, e87530, MARS, c00100, num, c05800,
     return c07230
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def CharityCredit(e19800, e20100, c00100, CR_Charity_rt, CR_Charity_f,
                   CR_Charity_frt, MARS, charity_credit):
     """
@@ -2854,7 +2847,7 @@ def CharityCredit(e19800, e20100, c00100, CR_Charity_rt, CR_Charity_f,
     return charity_credit
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def NonrefundableCredits(c05800, e07240, e07260, e07300, e07400,
                          e07600, p08000, odc,
                          personal_nonrefundable_credit,
@@ -2998,7 +2991,7 @@ def NonrefundableCredits(c05800, e07240, e07260, e07300, e07400,
             personal_nonrefundable_credit)
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def AdditionalCTC(codtc_limited, ACTC_c, n24, earned, ACTC_Income_thd,
                   ACTC_rt, nu06, ACTC_rt_bonus_under6family, ACTC_ChildNum,
                   CTC_refundable, CTC_include17, XTOT, n21, n1820, num,
@@ -3084,7 +3077,7 @@ def AdditionalCTC(codtc_limited, ACTC_c, n24, earned, ACTC_Income_thd,
     return c11070
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def C1040(c05800, c07180, c07200, c07220, c07230, c07240, c07260, c07300,
           c07400, c07600, c08000, e09700, e09800, e09900, niit, othertaxes,
           c07100, c09200, odc, charity_credit,
@@ -3160,7 +3153,7 @@ def C1040(c05800, c07180, c07200, c07220, c07230, c07240, c07260, c07300,
     return (c07100, othertaxes, c09200)
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def CTC_new(CTC_new_c, CTC_new_rt, CTC_new_c_under6_bonus,
             CTC_new_ps, CTC_new_prt, CTC_new_for_all, CTC_include17,
             CTC_new_refund_limited, CTC_new_refund_limit_payroll_rt,
@@ -3240,7 +3233,7 @@ def CTC_new(CTC_new_c, CTC_new_rt, CTC_new_c_under6_bonus,
     return ctc_new
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def IITAX(c59660, c11070, c10960, personal_refundable_credit, ctc_new, rptc,
           c09200, payrolltax, CDCC_refund, recovery_rebate_credit,
           eitc, c07220, CTC_refundable, refund, iitax, combined):
@@ -3298,7 +3291,7 @@ def IITAX(c59660, c11070, c10960, personal_refundable_credit, ctc_new, rptc,
     return (eitc, refund, iitax, combined)
 
 
-@JIT(nopython=True)
+@cache_safe_jit(nopython=True, cache=True)
 def Taxes(income, MARS, tbrk_base,
           rate1, rate2, rate3, rate4, rate5, rate6, rate7, rate8,
           tbrk1, tbrk2, tbrk3, tbrk4, tbrk5, tbrk6, tbrk7):
@@ -3493,7 +3486,7 @@ def BenefitLimitation(calc):
         calc.incarray('combined', excess_benefit)
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def FairShareTax(c00100, MARS, ptax_was, setax, ptax_amc,
                  FST_AGI_trt, FST_AGI_thd_lo, FST_AGI_thd_hi,
                  fstax, iitax, combined, surtax):
@@ -3552,7 +3545,7 @@ def FairShareTax(c00100, MARS, ptax_was, setax, ptax_amc,
     return (fstax, iitax, combined, surtax)
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def LumpSumTax(DSI, num, XTOT,
                LST,
                lumpsum_tax, combined):
@@ -3589,7 +3582,7 @@ def LumpSumTax(DSI, num, XTOT,
     return (lumpsum_tax, combined)
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def ExpandIncome(e00200, pencon_p, pencon_s, e00300, e00400, e00600,
                  e00700, e00800, e00900, e01100, e01200, e01400, e01500,
                  e02000, e02100, p22250, p23250, cmbtp, ptax_was,
@@ -3674,7 +3667,7 @@ def ExpandIncome(e00200, pencon_p, pencon_s, e00300, e00400, e00600,
     return expanded_income
 
 
-@iterate_jit(nopython=True)
+@iterate_jit(nopython=True, cache=True)
 def AfterTaxIncome(combined, expanded_income, aftertax_income):
     """
     Calculates after-tax expanded income.
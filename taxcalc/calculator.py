@@ -205,7 +205,7 @@ class Calculator():
             assert isinstance(variable_list, list)
             varlist = variable_list
         arys = [self.array(varname) for varname in varlist]
-        dframe = pd.DataFrame(data=np.column_stack(arys), columns=varlist)
+        dframe = pd.DataFrame(data=np.vstack(arys).T, columns=varlist)
         del arys
         del varlist
         return dframe
@@ -45,6 +45,39 @@ else:
     JIT = numba.jit
 
 
+def cache_safe_jit(**kwargs):
+    """
+    Return JIT decorator using the specified keyword arguments, except that
+    a function numba cannot cache on disk (because it finds no writable
+    cache location) is jitted without the cache keyword argument.
+    """
+    def wrap(fnc):
+        """
+        wrap function nested in cache_safe_jit function.
+        """
+        try:
+            return JIT(**kwargs)(fnc)
+        except RuntimeError:
+            if not kwargs.get('cache', False):
+                raise
+            uncached_kwargs = {key: val for key, val in kwargs.items()
+                               if key != 'cache'}
+            return JIT(**uncached_kwargs)(fnc)
+    return wrap
+
+
+# names of keyword arguments that iterate_jit passes on to JIT
+JIT_ARGS = tuple(inspect.getfullargspec(JIT).args) + ('nopython',)
+
+# names of Policy parameters (with and without their first character) that
+# are treated as parameters rather than records in calc-style functions;
+# computed once here rather than reading the policy JSON file in each
+# iterate_jit decoration
+PARAMETER_LIST = Policy.parameter_list()
+ALLOWED_PARAMETERS = frozenset(PARAMETER_LIST +
+                               [arg[1:] for arg in PARAMETER_LIST])
+
+
 class GetReturnNode(ast.NodeVisitor):
     """
     A NodeVisitor to get the return tuple names from a calc-style function.
@@ -155,8 +188,10 @@ def create_toplevel_function_string(args_out, args_in, pm_or_pf):
         fstr.write("    return DataFrame(data=outputs,"
                    "columns=header)")
     else:
-        fstr.write("    return DataFrame(data=np.column_stack("
-                   "outputs),columns=header)")
+        # stack outputs as rows and transpose the result, which gives
+        # DataFrame a column-major array that it can use without copying
+        fstr.write("    return DataFrame(data=np.vstack("
+                   "outputs).T,columns=header)")
     return fstr.getvalue()
 
 
@@ -183,9 +218,17 @@ def make_apply_function(func, out_args, in_args, parameters,
     Returns
     -------
     apply-style function
+
+    Notes
+    -----
+    A cache keyword argument applies only to the calc-style function,
+    because the apply-style function is compiled from a string and so
+    has no source file in which numba can cache its compiled code.  When
+    numba finds no writable cache location, the calc-style function is
+    jitted without caching.
     """
     if do_jit:
-        jitted_f = JIT(**kwargs)(func)
+        jitted_f = cache_safe_jit(**kwargs)(func)
     else:
         jitted_f = func
     apfunc = create_apply_function_string(out_args, in_args, parameters)
@@ -194,7 +237,8 @@ def make_apply_function(func, out_args, in_args, parameters,
     eval(func_code,  # pylint: disable=eval-used
          {"jitted_f": jitted_f}, fakeglobals)
     if do_jit:
-        return JIT(**kwargs)(fakeglobals['ap_func'])
+        ap_kwargs = {key: val for key, val in kwargs.items() if key != 'cache'}
+        return JIT(**ap_kwargs)(fakeglobals['ap_func'])
     return fakeglobals['ap_func']
 
 
@@ -242,6 +286,10 @@ def iterate_jit(parameters=None, **kwargs):
     Public decorator for a calc-style function (see calcfunctions.py) that
     transforms the calc-style function into an apply-style function that
     can be called by Calculator class methods (see calculator.py).
+
+    Specifying cache=True has numba cache the jitted calc-style function
+    on disk, so it is compiled only when its source file changes rather
+    than once in every Python process.
     """
 
     if not parameters:
@@ -256,20 +304,16 @@ def iterate_jit(parameters=None, **kwargs):
         # Get the input arguments from the function
         in_args = inspect.getfullargspec(func).args
         # Get the numba.jit arguments
-        jit_args_list = inspect.getfullargspec(JIT).args + ['nopython']
         kwargs_for_jit = dict()
         for key, val in kwargs.items():
-            if key in jit_args_list:
+            if key in JIT_ARGS:
                 kwargs_for_jit[key] = val
 
         # Any name that is a parameter
         # Boolean flag is given special treatment.
         # Identify those names here
-        param_list = Policy.parameter_list()
-        allowed_parameters = param_list
-        allowed_parameters += list(arg[1:] for arg in param_list)
         additional_parameters = [arg for arg in in_args if
-                                 arg in allowed_parameters]
+                                 arg in ALLOWED_PARAMETERS]
         additional_parameters += parameters
         # Remote duplicates
         all_parameters = list(set(additional_parameters))
@@ -6,6 +6,7 @@ import pandas
 import pytest
 
 from pytest_harvest import get_session_results_df
+from taxcalc import Records  # pylint: disable=import-error
 
 
 # convert all numpy warnings into errors so they can be detected in tests
@@ -23,6 +24,15 @@ def tests_path():
     return os.path.abspath(os.path.dirname(__file__))
 
 
+@pytest.fixture(scope='session')
+def records_varinfo():
+    """
+    Return Records object that contains only the Records VARINFO, which is
+    constructed once and must not be modified by tests.
+    """
+    return Records(data=None)
+
+
 @pytest.fixture(scope='session')
 def cps_path(tests_path):
     return os.path.join(tests_path, '..', 'cps.csv.gz')
@@ -8,12 +8,39 @@ Tests for Tax-Calculator calcfunctions.py logic.
 import os
 import re
 import ast
-from taxcalc import Records  # pylint: disable=import-error
 from taxcalc import calcfunctions
 import numpy as np
 import pytest
 
 
+COMMENT_RE = re.compile('#.*')  # matches all '#...' comments
+FUNCTION_RE = re.compile(r'^(.+?)\((.*?)\):(.*)$')  # name, args, code
+IDENTIFIER_RE = re.compile(r'[A-Za-z_]\w*')  # matches all identifiers
+
+
+class GetStoreNames(ast.NodeVisitor):
+    """
+    Collect, in a single pass, the set of names assigned in a function body.
+    """
+    def __init__(self):
+        """
+        GetStoreNames class constructor
+        """
+        self.names = set()  # names stored anywhere in the visited nodes
+
+    def visit_Name(self, node):  # pylint: disable=invalid-name
+        """
+        visit the specified Name node
+        """
+        if isinstance(node.ctx, ast.Store):
+            self.names.add(node.id)
+
+    def visit_Return(self, node):  # pylint: disable=invalid-name
+        """
+        skip the specified Return node
+        """
+
+
 class GetFuncDefs(ast.NodeVisitor):
     """
     Return information about each function defined in the functions.py file.
@@ -44,15 +71,9 @@ class GetFuncDefs(ast.NodeVisitor):
         self.fargs[self.fname] = list()
         for anode in ast.iter_child_nodes(node.args):
             self.fargs[self.fname].append(anode.arg)
-        self.cvars[self.fname] = list()
-        for bodynode in node.body:
-            if isinstance(bodynode, ast.Return):
-                continue  # skip function's Return node
-            for bnode in ast.walk(bodynode):
-                if isinstance(bnode, ast.Name):
-                    if isinstance(bnode.ctx, ast.Store):
-                        if bnode.id not in self.cvars[self.fname]:
-                            self.cvars[self.fname].append(bnode.id)
+        collector = GetStoreNames()
+        collector.visit(node)
+        self.cvars[self.fname] = list(collector.names)
         self.generic_visit(node)
 
     def visit_Return(self, node):  # pylint: disable=invalid-name
@@ -68,7 +89,26 @@ class GetFuncDefs(ast.NodeVisitor):
         self.generic_visit(node)
 
 
-def test_calc_and_used_vars(tests_path):
+@pytest.fixture(scope='session', name='calcfuncs_source')
+def fixture_calcfuncs_source(tests_path):
+    """
+    Return contents of the calcfunctions.py file, which is read only once.
+    """
+    funcpath = os.path.join(tests_path, '..', 'calcfunctions.py')
+    with open(funcpath, 'r') as funcfile:
+        return funcfile.read()
+
+
+@pytest.fixture(scope='session', name='calcfuncs_defs')
+def fixture_calcfuncs_defs(calcfuncs_source):
+    """
+    Return (fnames, fargs, cvars, rvars) tuple generated by a GetFuncDefs
+    visit of the calcfunctions.py file, which is parsed only once.
+    """
+    return GetFuncDefs().visit(ast.parse(calcfuncs_source))
+
+
+def test_calc_and_used_vars(calcfuncs_defs, records_varinfo):
     """
     Runs two kinds of tests on variables used in the calcfunctions.py file:
 
@@ -83,9 +123,7 @@ def test_calc_and_used_vars(tests_path):
     returned by that function is an argument of that function.
     """
     # pylint: disable=too-many-locals
-    funcpath = os.path.join(tests_path, '..', 'calcfunctions.py')
-    gfd = GetFuncDefs()
-    fnames, fargs, cvars, rvars = gfd.visit(ast.parse(open(funcpath).read()))
+    fnames, fargs, cvars, rvars = calcfuncs_defs
     # Test (1):
     # .. create set of vars that are actually calculated in calcfunctions.py
     all_cvars = set()
@@ -99,7 +137,6 @@ def test_calc_and_used_vars(tests_path):
     all_cvars.update(set(['mtr_paytax', 'mtr_inctax']))
     all_cvars.update(set(['benefit_cost_total', 'benefit_value_total']))
     # .. check that each var in Records.CALCULATED_VARS is in the all_cvars set
-    records_varinfo = Records(data=None)
     found_error1 = False
     if not records_varinfo.CALCULATED_VARS <= all_cvars:
         msg1 = ('all Records.CALCULATED_VARS not calculated '
@@ -129,22 +166,19 @@ def test_calc_and_used_vars(tests_path):
         raise ValueError(msg2)
 
 
-def test_function_args_usage(tests_path):
+def test_function_args_usage(calcfuncs_source):
     """
     Checks each function argument in calcfunctions.py for use in its
     function body.
     """
-    funcfilename = os.path.join(tests_path, '..', 'calcfunctions.py')
-    with open(funcfilename, 'r') as funcfile:
-        fcontent = funcfile.read()
-    fcontent = re.sub('#.*', '', fcontent)  # remove all '#...' comments
-    fcontent = re.sub('\n', ' ', fcontent)  # replace EOL character with space
+    fcontent = COMMENT_RE.sub('', calcfuncs_source)  # remove all comments
+    fcontent = fcontent.replace('\n', ' ')  # replace EOL character with space
     funcs = fcontent.split('def ')  # list of function text
     msg = 'FUNCTION ARGUMENT(S) NEVER USED:\n'
     found_error = False
     for func in funcs[1:]:  # skip first item in list, which is imports, etc.
         fcode = func.split('return ')[0]  # fcode is between def and return
-        match = re.search(r'^(.+?)\((.*?)\):(.*)$', fcode)
+        match = FUNCTION_RE.search(fcode)
         if match is None:
             msg = ('Could not find function name, arguments, '
                    'and code portions in the following text:\n')
@@ -157,9 +191,10 @@ def test_function_args_usage(tests_path):
         fbody = match.group(3)
         if fname == 'Taxes':
             continue  # because Taxes has part of fbody in return statement
+        used = set(IDENTIFIER_RE.findall(fbody))  # identifiers in fbody
         for farg in fargs:
             arg = farg.strip()
-            if fbody.find(arg) < 0:
+            if arg not in used:
                 found_error = True
                 msg += 'FUNCTION,ARGUMENT= {} {}\n'.format(fname, arg)
     if found_error:
@@ -179,8 +214,8 @@ def test_DependentCare(skip_jit):
     assert np.allclose(test_value, expected_value)
 
 
-STD_in = [6000, 12000, 6000, 12000, 12000]
-STD_Aged_in = [1500, 1200, 1500, 1500, 1500]
+STD_in = np.array([6000, 12000, 6000, 12000, 12000], dtype=np.float64)
+STD_Aged_in = np.array([1500, 1200, 1500, 1500, 1500], dtype=np.float64)
 tuple1 = (0, 1000, STD_in, 45, 44, STD_Aged_in, 1000, 2, 0, 0, 0, 2, 0,
           False, 0)
 tuple2 = (0, 1000, STD_in, 66, 44, STD_Aged_in, 1000, 2, 0, 1, 1, 2,
@@ -199,7 +234,12 @@ tuple8 = (1, 200, STD_in, 44, 0, STD_Aged_in, 1000, 3, 0, 0, 0, 2, 0,
           True, 0)
 tuple9 = (1, 1000, STD_in, 44, 0, STD_Aged_in, 1000, 3, 0, 0, 0, 2, 0,
           True, 0)
-expected = [12000, 15800, 13500, 14400, 6000, 6000, 0, 1000, 1350]
+tuple10 = (0, 1000, STD_in, 44, 70, STD_Aged_in, 1000, 1, 0, 0, 0, 2, 0,
+           False, 0)
+tuple11 = (0, 1000, STD_in, 66, 70, STD_Aged_in, 1000, 4, 0, 0, 0, 2, 0,
+           False, 0)
+expected = [12000, 15800, 13500, 14400, 6000, 6000, 0, 1000, 1350, 6000,
+            13500]
 
 
 @pytest.mark.parametrize(
@@ -208,12 +248,14 @@ expected = [12000, 15800, 13500, 14400, 6000, 6000, 0, 1000, 1350]
         (tuple3, expected[2]), (tuple4, expected[3]),
         (tuple5, expected[4]), (tuple6, expected[5]),
         (tuple7, expected[6]), (tuple8, expected[7]),
-        (tuple9, expected[8])], ids=[
+        (tuple9, expected[8]), (tuple10, expected[9]),
+        (tuple11, expected[10])], ids=[
             'Married, young', 'Married, allow charity',
             'Married, allow charity, over limit',
             'Married, two old', 'Single 1', 'Single 2', 'Married, Single',
             'Marrid, Single, dep, under earn',
-            'Married, Single, dep, over earn'])
+            'Married, Single, dep, over earn',
+            'Single, old spouse', 'Head of household, old, old spouse'])
 def test_StdDed(test_tuple, expected_value, skip_jit):
     """
     Tests the StdDed function
@@ -268,8 +310,10 @@ def test_LumpSumTax(test_tuple, expected_value, skip_jit):
     assert np.allclose(test_value, expected_value)
 
 
-FST_AGI_thd_lo_in = [1000000, 1000000, 500000, 1000000, 1000000]
-FST_AGI_thd_hi_in = [2000000, 2000000, 1000000, 2000000, 2000000]
+FST_AGI_thd_lo_in = np.array([1000000, 1000000, 500000, 1000000, 1000000],
+                             dtype=np.float64)
+FST_AGI_thd_hi_in = np.array([2000000, 2000000, 1000000, 2000000, 2000000],
+                             dtype=np.float64)
 tuple1 = (1100000, 1, 1000, 100, 100, 0.1, FST_AGI_thd_lo_in,
           FST_AGI_thd_hi_in, 100, 200, 2000, 300)
 tuple2 = (2100000, 1, 1000, 100, 100, 0.1, FST_AGI_thd_lo_in,
@@ -312,20 +356,23 @@ def test_FairShareTax(test_tuple, expected_value, skip_jit):
     assert np.allclose(test_value, expected_value)
 
 
-II_credit_ARPA = [0, 0, 0, 0, 0]
-II_credit_ps_ARPA = [0, 0, 0, 0, 0]
-II_credit_nr_ARPA = [0, 0, 0, 0, 0]
-II_credit_nr_ps_ARPA = [0, 0, 0, 0, 0]
-RRC_ps_ARPA = [75000, 150000, 75000, 112500, 150000]
-RRC_pe_ARPA = [80000, 160000, 80000, 120000, 160000]
-RRC_c_unit_ARPA = [0, 0, 0, 0, 0]
-II_credit_CARES = [0, 0, 0, 0, 0]
-II_credit_ps_CARES = [0, 0, 0, 0, 0]
-II_credit_nr_CARES = [0, 0, 0, 0, 0]
-II_credit_nr_ps_CARES = [0, 0, 0, 0, 0]
-RRC_ps_CARES = [75000, 150000, 75000, 112500, 75000]
-RRC_pe_CARES = [0, 0, 0, 0, 0]
-RRC_c_unit_CARES = [1200, 2400, 1200, 1200, 1200]
+II_credit_ARPA = np.array([0, 0, 0, 0, 0], dtype=np.float64)
+II_credit_ps_ARPA = np.array([0, 0, 0, 0, 0], dtype=np.float64)
+II_credit_nr_ARPA = np.array([0, 0, 0, 0, 0], dtype=np.float64)
+II_credit_nr_ps_ARPA = np.array([0, 0, 0, 0, 0], dtype=np.float64)
+RRC_ps_ARPA = np.array([75000, 150000, 75000, 112500, 150000],
+                       dtype=np.float64)
+RRC_pe_ARPA = np.array([80000, 160000, 80000, 120000, 160000],
+                       dtype=np.float64)
+RRC_c_unit_ARPA = np.array([0, 0, 0, 0, 0], dtype=np.float64)
+II_credit_CARES = np.array([0, 0, 0, 0, 0], dtype=np.float64)
+II_credit_ps_CARES = np.array([0, 0, 0, 0, 0], dtype=np.float64)
+II_credit_nr_CARES = np.array([0, 0, 0, 0, 0], dtype=np.float64)
+II_credit_nr_ps_CARES = np.array([0, 0, 0, 0, 0], dtype=np.float64)
+RRC_ps_CARES = np.array([75000, 150000, 75000, 112500, 75000],
+                        dtype=np.float64)
+RRC_pe_CARES = np.array([0, 0, 0, 0, 0], dtype=np.float64)
+RRC_c_unit_CARES = np.array([1200, 2400, 1200, 1200, 1200], dtype=np.float64)
 tuple1 = (1, 50000, 1, 0, II_credit_ARPA, II_credit_ps_ARPA, 0,
           II_credit_nr_ARPA, II_credit_nr_ps_ARPA, 0, 1400, RRC_ps_ARPA,
           RRC_pe_ARPA, 0, 0, RRC_c_unit_ARPA, 0, 0, 0)
@@ -380,6 +427,28 @@ tuple17 = (4, 130000, 2, 1, II_credit_CARES, II_credit_ps_CARES, 0,
 tuple18 = (4, 170000, 3, 2, II_credit_CARES, II_credit_ps_CARES, 0,
            II_credit_nr_CARES, II_credit_nr_ps_CARES, 0, 0, RRC_ps_CARES,
            RRC_pe_CARES, 0.05, 500, RRC_c_unit_CARES, 0, 0, 0)
+II_credit_in = np.array([1000, 2000, 1000, 1500, 2000], dtype=np.float64)
+II_credit_ps_in = np.array([50000, 100000, 50000, 75000, 100000],
+                           dtype=np.float64)
+II_credit_nr_in = np.array([500, 1000, 500, 750, 1000], dtype=np.float64)
+II_credit_nr_ps_in = np.array([40000, 80000, 40000, 60000, 80000],
+                              dtype=np.float64)
+RRC_zero_in = np.array([0, 0, 0, 0, 0], dtype=np.float64)
+tuple19 = (1, 30000, 1, 0, II_credit_in, II_credit_ps_in, 0.02,
+           II_credit_nr_in, II_credit_nr_ps_in, 0.01, 0, RRC_zero_in,
+           RRC_zero_in, 0, 0, RRC_zero_in, 0, 0, 0)
+tuple20 = (1, 50000, 1, 0, II_credit_in, II_credit_ps_in, 0.02,
+           II_credit_nr_in, II_credit_nr_ps_in, 0.01, 0, RRC_zero_in,
+           RRC_zero_in, 0, 0, RRC_zero_in, 0, 0, 0)
+tuple21 = (1, 80000, 1, 0, II_credit_in, II_credit_ps_in, 0.02,
+           II_credit_nr_in, II_credit_nr_ps_in, 0.01, 0, RRC_zero_in,
+           RRC_zero_in, 0, 0, RRC_zero_in, 0, 0, 0)
+tuple22 = (4, 60000, 2, 1, II_credit_in, II_credit_ps_in, 0.02,
+           II_credit_nr_in, II_credit_nr_ps_in, 0.01, 0, RRC_zero_in,
+           RRC_zero_in, 0, 0, RRC_zero_in, 0, 0, 0)
+tuple23 = (2, 200000, 2, 0, II_credit_in, II_credit_ps_in, 0.02,
+           II_credit_nr_in, II_credit_nr_ps_in, 0.01, 0, RRC_zero_in,
+           RRC_zero_in, 0, 0, RRC_zero_in, 0, 0, 0)
 expected1 = (0, 0, 1400)
 expected2 = (0, 0, 1120)
 expected3 = (0, 0, 0)
@@ -398,6 +467,11 @@ expected15 = (0, 0, 0)
 expected16 = (0, 0, 2200)
 expected17 = (0, 0, 825)
 expected18 = (0, 0, 0)
+expected19 = (1000, 500, 0)
+expected20 = (1000, 400, 0)
+expected21 = (400, 100, 0)
+expected22 = (1500, 750, 0)
+expected23 = (0, 0, 0)
 
 
 @pytest.mark.parametrize(
@@ -407,7 +481,9 @@ expected18 = (0, 0, 0)
         (tuple7, expected7), (tuple8, expected8), (tuple9, expected9),
         (tuple10, expected10), (tuple11, expected11), (tuple12, expected12),
         (tuple13, expected13), (tuple14, expected14), (tuple15, expected15),
-        (tuple16, expected16), (tuple17, expected17), (tuple18, expected18)])
+        (tuple16, expected16), (tuple17, expected17), (tuple18, expected18),
+        (tuple19, expected19), (tuple20, expected20), (tuple21, expected21),
+        (tuple22, expected22), (tuple23, expected23)])
 def test_PersonalTaxCredit(test_tuple, expected_value, skip_jit):
     """
     Tests the PersonalTaxCredit function
@@ -13,8 +13,7 @@ def test_year_consistency():
     assert Consumption.DEFAULT_NUM_YEARS == Policy.DEFAULT_NUM_YEARS
 
 
-def test_validity_of_consumption_vars_set():
-    records_varinfo = Records(data=None)
+def test_validity_of_consumption_vars_set(records_varinfo):
     assert Consumption.RESPONSE_VARS.issubset(records_varinfo.USABLE_READ_VARS)
     useable_vars = set(['housing', 'snap', 'tanf', 'vet', 'wic',
                         'mcare', 'mcaid', 'other'])
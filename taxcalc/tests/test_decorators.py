@@ -5,6 +5,7 @@ import os
 import sys
 import pytest
 import importlib
+import numba
 import numpy as np
 from pandas import DataFrame
 from pandas.testing import assert_frame_equal
@@ -48,7 +49,7 @@ def test_create_toplevel_function_string_mult_outputs():
            "        applied_f(get_values(pm.a[0]), get_values(pm.b[0]), "
            "get_values(pf.d), get_values(pm.e[0]), )\n"
            "    header = ['a', 'b']\n"
-           "    return DataFrame(data=np.column_stack(outputs),"
+           "    return DataFrame(data=np.vstack(outputs).T,"
            "columns=header)")
 
     assert ans == exp
@@ -330,3 +331,65 @@ def test_force_no_jit():
     # restore normal JIT operation of decorators module
     del os.environ['NOTAXCALCJIT']
     importlib.reload(taxcalc.decorators)
+
+
+@pytest.fixture(name='jit_calls')
+def fixture_jit_calls(monkeypatch):
+    """
+    Replace the JIT decorator with one that records its keyword arguments
+    and returns the undecorated function, and return the recorded calls.
+    """
+    calls = list()
+
+    def recording_jit(**kwargs):
+        calls.append(kwargs)
+        return lambda fnc: fnc
+
+    monkeypatch.setattr(taxcalc.decorators, 'JIT', recording_jit)
+    return calls
+
+
+@pytest.mark.parametrize('kwargs, calc_kwargs', [
+    ({'cache': True}, {'nopython': True, 'cache': True}),
+    ({'cache': False}, {'nopython': True, 'cache': False}),
+    ({}, {'nopython': True}),
+], ids=['cache', 'no cache', 'cache omitted'])
+def test_iterate_jit_cache_forwarding(kwargs, calc_kwargs, jit_calls):
+    """
+    Check that iterate_jit passes the cache option to the jit of the
+    calc-style function but not to the jit of the apply-style function,
+    and that it does not cache unless cache=True is specified.
+    """
+    iterate_jit(nopython=True, **kwargs)(some_calc)
+    assert jit_calls == [calc_kwargs, {'nopython': True}]
+
+
+def scalar_calc(x):
+    return x + 1.
+
+
+def test_cache_safe_jit_without_cache_locator(monkeypatch):
+    """
+    Check that cache=True functions are jitted without caching, and that
+    calcfunctions.py can be imported, when numba has no cache location.
+    """
+    with monkeypatch.context() as mpc:
+        mpc.setattr(numba.core.caching.CacheImpl, '_locator_classes', [])
+        with pytest.raises(RuntimeError):
+            numba.jit(nopython=True, cache=True)(scalar_calc)
+        jitted_calc = cache_safe_jit(nopython=True, cache=True)(scalar_calc)
+        assert jitted_calc(1.) == 2.
+        magic_calc = iterate_jit(nopython=True, cache=True)(some_calc)
+        pm = Foo()
+        pf = Foo()
+        pf.a = np.zeros((5,))
+        pf.b = np.zeros((5,))
+        pf.x = np.ones((5,))
+        pf.y = np.ones((5,))
+        pf.z = np.ones((5,))
+        ans = magic_calc(pm, pf)
+        exp = DataFrame(data=[[2.0, 3.0]] * 5, columns=["a", "b"])
+        assert_frame_equal(ans, exp)
+        importlib.reload(taxcalc.calcfunctions)
+    # restore cached functions in calcfunctions module
+    importlib.reload(taxcalc.calcfunctions)
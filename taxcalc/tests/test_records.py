@@ -119,8 +119,7 @@ def test_read_data(csv):
         Records(data=df)
 
 
-def test_for_duplicate_names():
-    records_varinfo = Records(data=None)
+def test_for_duplicate_names(records_varinfo):
     varnames = set()
     for varname in records_varinfo.USABLE_READ_VARS:
         assert varname not in varnames
@@ -198,7 +197,7 @@ def test_records_variables_content(tests_path):
                     assert msg1 == msg2
 
 
-def test_csv_input_vars_md_contents(tests_path):
+def test_csv_input_vars_md_contents(tests_path, records_varinfo):
     """
     Check CSV_INPUT_VARS.md contents against Records.USABLE_READ_VARS
     """
@@ -225,7 +224,6 @@ def test_csv_input_vars_md_contents(tests_path):
         if found_duplicates:
             raise ValueError(msg)
     # check that civ_set is a subset of Records.USABLE_READ_VARS set
-    records_varinfo = Records(data=None)
     if not civ_set.issubset(records_varinfo.USABLE_READ_VARS):
         valid_less_civ = records_varinfo.USABLE_READ_VARS - civ_set
         msg = 'VARIABLE(S) IN USABLE_READ_VARS BUT NOT CSV_INPUT_VARS.MD:\n'
@@ -55,9 +55,8 @@ DATA_FLOAT = [[1.0, 2, 'a'],
               [3.0, 6, 'b']]
 
 
-def test_validity_of_name_lists():
+def test_validity_of_name_lists(records_varinfo):
     assert len(DIST_TABLE_COLUMNS) == len(DIST_TABLE_LABELS)
-    records_varinfo = Records(data=None)
     assert set(DIST_VARIABLES).issubset(records_varinfo.CALCULATED_VARS |
                                         {'s006', 'XTOT'})
     extra_vars_set = set(['count',
@@ -12,7 +12,7 @@ import numpy as np
 import pandas as pd
 
 
-def main():
+def main(argv=None):
     """
     High-level logic.
     """
@@ -33,7 +33,7 @@ def main():
     parser.add_argument('OUTPUT', nargs='?', default='',
                         help=('OUTPUT is name of file that will contain '
                               'CSV-formatted Tax-Calculator tc input.'))
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     # check INPUT filename
     if args.INPUT == '':
         sys.stderr.write('ERROR: must specify INPUT file name\n')
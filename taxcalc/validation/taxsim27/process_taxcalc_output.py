@@ -11,7 +11,7 @@ import sys
 import pandas as pd
 
 
-def main():
+def main(argv=None):
     """
     High-level logic.
     """
@@ -35,7 +35,7 @@ def main():
     parser.add_argument('OUTPUT', nargs='?', default='',
                         help=('OUTPUT is name of file that will contain '
                               'output formatted like TAXSIM-27 output.'))
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     # check INPUT filename
     if args.INPUT == '':
         sys.stderr.write('ERROR: must specify INPUT file name\n')
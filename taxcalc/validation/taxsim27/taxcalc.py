@@ -2,6 +2,9 @@ import argparse
 import os
 import sys
 import shutil
+import subprocess
+import prepare_taxcalc_input
+import process_taxcalc_output
 
 
 usage_str = 'python taxcalc.py LYY_FILENAME [--save] [--help]'
@@ -43,18 +46,19 @@ YY = taxsim_in[1:3]
 
 
 # prepare Tax-Calculator input file
+# (in this process, so as not to start another Python interpreter)
 def prep_tc_input():
-    command = "python prepare_taxcalc_input.py " + taxsim_in + \
-        " " + taxsim_in_csv
-    os.system(command)
+    if prepare_taxcalc_input.main([taxsim_in, taxsim_in_csv]) != 0:
+        sys.exit("ERROR: prepare_taxcalc_input.py failed")
 
 
 # calculate Tax-Calculator output
 def calc_tc_output():
     year = '20' + YY
-    command = "tc " + taxsim_in_csv + " " + year + \
-        " --reform taxsim_emulation.json --dump"
-    os.system(command)
+    command = ["tc", taxsim_in_csv, year,
+               "--reform", "taxsim_emulation.json", "--dump"]
+    if subprocess.run(command).returncode != 0:
+        sys.exit("ERROR: tc failed")
 
     file_temp = taxsim_in + "-" + YY + "-#-taxsim_emulation-#.csv"
     file_temp_path = os.path.join(CURR_PATH, file_temp)
@@ -67,11 +71,11 @@ def calc_tc_output():
 
 
 # convert Tax-Calculator output to TAXSIM-27 format
+# (in this process, so as not to start another Python interpreter)
 def convert_to_taxsim():
     file_out = taxsim_in + ".out-taxcalc"
-    command = "python process_taxcalc_output.py " + taxsim_out_csv + \
-        " " + file_out
-    os.system(command)
+    if process_taxcalc_output.main([taxsim_out_csv, file_out]) != 0:
+        sys.exit("ERROR: process_taxcalc_output.py failed")
 
 
 # delete intermediate input and output files if not saving